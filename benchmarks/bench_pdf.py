@@ -0,0 +1,122 @@
+"""
+Per-certificate PDF render cost: current create_certificate_pdf vs the
+original implementation that redrew the whole layout for every certificate.
+
+Usage: python benchmarks/bench_pdf.py [iterations]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qrcode
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import landscape, A4
+from reportlab.lib.utils import ImageReader
+
+import app
+
+SAMPLE_DATA = {
+    "id": "0b3c1a0e-1111-4222-8333-444455556666",
+    "name": "Jane Doe",
+    "course": "Bitcoin Development",
+    "cohort": "Cohort 2024",
+    "issued_at": "2024-01-01 00:00:00 UTC"
+}
+SAMPLE_SIGNATURE = "x" * 88
+SAMPLE_URL = "https://certs.bitcoindada.com/verify/" + SAMPLE_DATA["id"]
+
+
+def legacy_certificate_pdf(data, signature_b64, verify_url):
+    """The original renderer, kept verbatim as the benchmark baseline"""
+    buffer = io.BytesIO()
+    width, height = landscape(A4)
+    c = canvas.Canvas(buffer, pagesize=(width, height))
+    c.setFillColorRGB(0.95, 0.95, 0.98)
+    c.rect(0, 0, width, height, fill=1)
+    c.setStrokeColorRGB(0.2, 0.4, 0.8)
+    c.setLineWidth(8)
+    c.rect(20, 20, width-40, height-40, stroke=1, fill=0)
+    c.setFillColorRGB(0.1, 0.3, 0.6)
+    c.setFont("Helvetica-Bold", 36)
+    c.drawCentredString(width/2, height - 120, "BITCOIN DADA")
+    c.setFont("Helvetica-Bold", 28)
+    c.drawCentredString(width/2, height - 170, "Certificate of Completion")
+    c.setFillColorRGB(0.2, 0.2, 0.2)
+    c.setFont("Helvetica", 20)
+    c.drawCentredString(width/2, height - 250, "This certifies that")
+    c.setFillColorRGB(0.1, 0.3, 0.6)
+    c.setFont("Helvetica-Bold", 28)
+    c.drawCentredString(width/2, height - 300, data.get('name', '').upper())
+    c.setFillColorRGB(0.2, 0.2, 0.2)
+    c.setFont("Helvetica", 18)
+    c.drawCentredString(width/2, height - 350, f"has successfully completed the {data.get('course', '')}")
+    c.drawCentredString(width/2, height - 380, f"Cohort: {data.get('cohort', '')}")
+    c.setFont("Helvetica", 12)
+    c.drawString(80, 200, f"Certificate ID: {data.get('id')}")
+    c.drawString(80, 180, f"Issued: {data.get('issued_at')}")
+    c.drawString(80, 160, f"Signature: {signature_b64[:50]}...")
+    qr = qrcode.make(verify_url)
+    qr_buffer = io.BytesIO()
+    qr.save(qr_buffer, format="PNG")
+    qr_buffer.seek(0)
+    c.drawImage(ImageReader(qr_buffer), width - 220, 90, width=160, height=160)
+    c.setFont("Helvetica-Oblique", 10)
+    c.drawString(width - 220, 70, "Scan to verify authenticity")
+    c.showPage()
+    c.save()
+    buffer.seek(0)
+    return buffer.read()
+
+
+def legacy_layout_only(data, signature_b64, verify_url):
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(app.PAGE_WIDTH, app.PAGE_HEIGHT))
+    app.draw_static_layout(c)
+    c.showPage()
+    c.save()
+    return buffer.getvalue()
+
+
+def cached_layout_only(data, signature_b64, verify_url):
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=(app.PAGE_WIDTH, app.PAGE_HEIGHT))
+    app.register_layout_fonts(c)
+    c.addLiteral(app.static_layout_ops()[0])
+    c.showPage()
+    c.save()
+    return buffer.getvalue()
+
+
+def time_render(fn, iterations):
+    fn(SAMPLE_DATA, SAMPLE_SIGNATURE, SAMPLE_URL)  # warm up caches
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pdf = fn(SAMPLE_DATA, SAMPLE_SIGNATURE, SAMPLE_URL)
+    elapsed = time.perf_counter() - start
+    return {"ms_per_pdf": round(elapsed / iterations * 1000, 3), "bytes": len(pdf)}
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    results = {"iterations": iterations}
+    for label, baseline, candidate in (
+        ("full_pdf", legacy_certificate_pdf, app.create_certificate_pdf),
+        ("static_layout", legacy_layout_only, cached_layout_only),
+    ):
+        legacy = time_render(baseline, iterations)
+        current = time_render(candidate, iterations)
+        results[label] = {
+            "legacy": legacy,
+            "current": current,
+            "speedup": round(legacy["ms_per_pdf"] / current["ms_per_pdf"], 2)
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
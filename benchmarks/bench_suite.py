@@ -0,0 +1,363 @@
+"""
+Benchmark suite for the issuance and verification hot paths.
+
+Runs fully offline: the app is pointed at a throwaway SQLite database (the
+local stand-in for Supabase), a throwaway signing key and throwaway cache
+directories, so nothing touches the network or the working tree.
+
+Start-up measures a cold "import app" in fresh interpreters against a target
+(STARTUP_TARGET_MS) for both storage backends; nothing may touch the network.
+Micro benchmarks time single operations (canonical JSON, sign, verify, QR,
+PDF render, Merkle batch signing). Macro scenarios drive the Flask app through
+its test client: bulk CSV issuance (ZIP and merged PDF), verification storms on hot and cold IDs,
+and the /manage listing over a large table.
+
+Usage:
+    python benchmarks/bench_suite.py                 # everything, full sizes
+    python benchmarks/bench_suite.py --quick         # smaller sizes for a smoke run
+    python benchmarks/bench_suite.py --only micro    # or startup, macro, or a scenario name
+    python benchmarks/bench_suite.py --out results.json
+    python benchmarks/bench_suite.py --compare baseline.json
+
+Results are printed (or written) as JSON tagged with the git commit so runs
+can be compared across commits.
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKDIR = tempfile.mkdtemp(prefix="dada_bench_")
+
+# Must be set before app is imported: configuration is read at import time
+os.environ.update({
+    "STORAGE_BACKEND": "sqlite",
+    "SQLITE_PATH": os.path.join(WORKDIR, "bench_0.db"),
+    "KEY_FILE": os.path.join(WORKDIR, "signing_key.base64"),
+    "PDF_CACHE_DIR": os.path.join(WORKDIR, "pdf_cache"),
+    "BULK_JOB_DIR": os.path.join(WORKDIR, "jobs"),
+})
+sys.path.insert(0, ROOT)
+
+# The app reports its start-up progress on stdout, which is reserved for the JSON report
+with contextlib.redirect_stdout(sys.stderr):
+    import app  # noqa: E402
+
+SAMPLE_DATA = {
+    "id": "0b3c1a0e-1111-4222-8333-444455556666",
+    "name": "Jane Doe",
+    "course": "Bitcoin Development",
+    "cohort": "Cohort 2024",
+    "issued_at": "2024-01-01 00:00:00 UTC"
+}
+SAMPLE_URL = "https://certs.bitcoindada.com/verify/" + SAMPLE_DATA["id"]
+
+# Cold import budget for a worker process, in milliseconds
+STARTUP_TARGET_MS = 300
+
+SIZES = {
+    "full": {"startup_runs": 15, "micro_iterations": 500, "bulk_rows": (1000, 10000), "storm_requests": 5000,
+             "storm_threads": 8, "manage_rows": 100000},
+    "quick": {"startup_runs": 5, "micro_iterations": 50, "bulk_rows": (100, 1000), "storm_requests": 500,
+              "storm_threads": 4, "manage_rows": 10000},
+}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(samples):
+    """Latency summary in milliseconds for a list of per-operation durations (seconds)"""
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(pct(50), 4),
+        "p95_ms": round(pct(95), 4),
+        "p99_ms": round(pct(99), 4),
+        "ops_per_sec": round(len(ordered) / sum(ordered), 1) if sum(ordered) else None
+    }
+
+
+def time_op(fn, iterations):
+    fn()  # warm up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+# Start-up
+def bench_startup(sizes):
+    """Wall time of "import app" in a fresh interpreter, minus bare interpreter start-up"""
+    def run(code, env):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return time.perf_counter() - start
+
+    results = {"target_ms": STARTUP_TARGET_MS}
+    baseline = statistics.median(run("pass", os.environ) for _ in range(sizes["startup_runs"]))
+    for backend in ("sqlite", "supabase"):
+        # An unroutable Supabase URL proves import never waits on the network
+        env = dict(os.environ, STORAGE_BACKEND=backend, SUPABASE_URL="http://127.0.0.1:9")
+        samples = [run("import app", env) - baseline for _ in range(sizes["startup_runs"])]
+        summary = summarize(samples)
+        summary["within_target"] = summary["p50_ms"] <= STARTUP_TARGET_MS
+        results[f"import_{backend}"] = summary
+    return results
+
+
+# Micro benchmarks
+def bench_micro(sizes):
+    n = sizes["micro_iterations"]
+    _, data, signature = app.sign_certificate("Jane Doe", "Bitcoin Development", "Cohort 2024")
+    cert_id = data["id"]
+    signature_bytes = base64.b64decode(signature)
+    merkle_people = [(f"Student {i}", "Bitcoin Development", "Cohort 2024") for i in range(app.BULK_BATCH_SIZE)]
+
+    def verify_cold():
+        app.CertificateVerifier(app.vk).verify(cert_id, data, signature)
+
+    return {
+        "canonical_json": time_op(lambda: app.serialize_data(SAMPLE_DATA), n * 10),
+        "sign": time_op(lambda: app.sign_certificate("Jane Doe", "Bitcoin Development", "Cohort 2024"), n),
+        "verify_ed25519": time_op(lambda: app.vk.verify(app.serialize_data(data), signature_bytes), n),
+        "verify_cold": time_op(verify_cold, n),
+        "verify_memoized": time_op(lambda: app.verifier.verify(cert_id, data, signature), n * 10),
+        f"merkle_sign_batch_{len(merkle_people)}": time_op(lambda: app.sign_certificates_merkle(merkle_people),
+                                                           max(1, n // 10)),
+        "qr_matrix": time_op(lambda: app.qr_matrix(SAMPLE_URL), n),
+        "pdf_render": time_op(lambda: app.create_certificate_pdf(SAMPLE_DATA, signature, SAMPLE_URL), n),
+    }
+
+
+# Macro scenarios
+_databases = iter(range(1, 1000))
+
+def reset_database():
+    """Point the app at a fresh, empty SQLite database"""
+    app.storage = app.SQLiteStorage(os.path.join(WORKDIR, f"bench_{next(_databases)}.db"))
+    app.init_db()
+    app.invalidate_stats()
+    app.verify_cache.clear()
+
+
+def roster_csv(rows):
+    lines = ["name,course,cohort"]
+    lines.extend(f"Student {i},Bitcoin Development,Cohort {i % 12}" for i in range(rows))
+    return ("\n".join(lines) + "\n").encode()
+
+
+def bench_bulk(client, rows):
+    reset_database()
+    start = time.perf_counter()
+    response = client.post("/bulk_create", data={
+        "csvfile": (io.BytesIO(roster_csv(rows)), "roster.csv"),
+        "delivery": "download"
+    }, content_type="multipart/form-data")
+    first_byte = time.perf_counter() - start
+    size = len(response.get_data())
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "status": response.status_code,
+        "seconds": round(elapsed, 3),
+        "time_to_first_byte_s": round(first_byte, 3),
+        "certs_per_sec": round(rows / elapsed, 1),
+        "zip_bytes": size
+    }
+
+
+def bench_bulk_merged(rows):
+    """Issue a roster into one merged PDF, the way a background job does"""
+    reset_database()
+    people = [(i + 2, f"Student {i}", "Bitcoin Development", f"Cohort {i % 12}") for i in range(rows)]
+    out = io.BytesIO()
+    start = time.perf_counter()
+    created = app.write_bulk_pdf(out, people, [], url_root="http://bench.local/")
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "created": created,
+        "seconds": round(elapsed, 3),
+        "certs_per_sec": round(rows / elapsed, 1),
+        "pdf_bytes": len(out.getvalue())
+    }
+
+
+def seed_certificates(count, chunk=2000):
+    """Insert signed certificates straight through the storage backend"""
+    ids = []
+    for start in range(0, count, chunk):
+        records = []
+        for i in range(start, min(count, start + chunk)):
+            cert_id, data, signature = app.sign_certificate(f"Student {i}", "Bitcoin Development",
+                                                            f"Cohort {i % 12}")
+            records.append(app.cert_record(cert_id, data, signature))
+            ids.append(cert_id)
+        app.storage.insert(records)
+    app.invalidate_stats()
+    return ids
+
+
+def storm(client_factory, paths, threads):
+    def worker(chunk):
+        client = client_factory()
+        samples = []
+        for path in chunk:
+            start = time.perf_counter()
+            response = client.get(path)
+            response.get_data()
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    chunks = [paths[i::threads] for i in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        samples = [s for chunk in pool.map(worker, chunks) for s in chunk]
+    elapsed = time.perf_counter() - start
+    result = summarize(samples)
+    result["wall_s"] = round(elapsed, 3)
+    result["requests_per_sec"] = round(len(paths) / elapsed, 1)
+    return result
+
+
+def bench_verify_storm(sizes):
+    reset_database()
+    ids = seed_certificates(max(1000, sizes["storm_requests"] // 5))
+    requests_count, threads = sizes["storm_requests"], sizes["storm_threads"]
+    hot = ids[:10]
+    return {
+        "hot_ids": storm(app.app.test_client, [f"/verify/{hot[i % len(hot)]}" for i in range(requests_count)],
+                         threads),
+        "cold_ids": storm(app.app.test_client, [f"/verify/{ids[i % len(ids)]}"
+                                                for i in range(min(requests_count, len(ids)))], threads),
+        "api_hot_ids": storm(app.app.test_client,
+                             [f"/api/certificate/{hot[i % len(hot)]}" for i in range(requests_count)], threads),
+    }
+
+
+def bench_manage(client, rows):
+    reset_database()
+    start = time.perf_counter()
+    seed_certificates(rows)
+    seeded = time.perf_counter() - start
+
+    def page(path):
+        app.invalidate_stats()
+        return lambda: client.get(path).get_data()
+
+    first = client.get("/manage?page_size=200")
+    deep_cursor = None
+    cursor = None
+    for _ in range(20):  # walk 20 pages in to get a realistic deep cursor
+        rows_page, cursor = app.db_list_page(cursor=cursor, limit=200)
+        if cursor:
+            deep_cursor = cursor
+    return {
+        "rows": rows,
+        "seed_s": round(seeded, 2),
+        "status": first.status_code,
+        "first_page": time_op(page("/manage?page_size=200"), 20),
+        "deep_page": time_op(page(f"/manage?page_size=200&cursor={deep_cursor}"), 20),
+        "search_name": time_op(page("/manage?page_size=50&q=Student%201234"), 20),
+        "filter_cohort": time_op(page("/manage?page_size=50&cohort=Cohort%207"), 20),
+    }
+
+
+def bench_macro(sizes, only=None):
+    client = app.app.test_client()
+    results = {}
+    for rows in sizes["bulk_rows"]:
+        name = f"bulk_csv_{rows}"
+        if only in (None, "macro", "bulk", name):
+            results[name] = bench_bulk(client, rows)
+        name = f"bulk_pdf_{rows}"
+        if only in (None, "macro", "bulk", name):
+            results[name] = bench_bulk_merged(rows)
+    if only in (None, "macro", "verify_storm"):
+        results["verify_storm"] = bench_verify_storm(sizes)
+    name = f"manage_{sizes['manage_rows']}"
+    if only in (None, "macro", "manage", name):
+        results[name] = bench_manage(client, sizes["manage_rows"])
+    return results
+
+
+def compare(baseline, current, path=""):
+    """Yield (scenario, baseline, current, ratio) for every matching timing in two reports"""
+    for key, value in current.items():
+        if key not in baseline:
+            continue
+        if isinstance(value, dict):
+            yield from compare(baseline[key], value, f"{path}{key}.")
+        elif key in ("mean_ms", "p95_ms", "seconds") and baseline[key]:
+            yield f"{path}{key}", baseline[key], value, round(value / baseline[key], 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes for a smoke run")
+    parser.add_argument("--only", help="startup, micro, macro, bulk, verify_storm, manage or a scenario name")
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", help="earlier JSON report; adds current/baseline ratios to the output")
+    args = parser.parse_args()
+    sizes = SIZES["quick" if args.quick else "full"]
+
+    results = {}
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.only in (None, "startup"):
+            results["startup"] = bench_startup(sizes)
+        if args.only in (None, "micro"):
+            results["micro"] = bench_micro(sizes)
+        if args.only not in ("startup", "micro"):
+            results["macro"] = bench_macro(sizes, args.only)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sizes": "quick" if args.quick else "full",
+        "results": results
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        report["baseline_commit"] = baseline.get("commit")
+        report["ratios"] = {name: {"baseline": old, "current": new, "ratio": ratio}
+                            for name, old, new, ratio in compare(baseline["results"], results)}
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
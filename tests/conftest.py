@@ -0,0 +1,66 @@
+"""
+Shared fixtures. The app reads its configuration at import time, so it is
+pointed at a throwaway SQLite database, signing key and cache directories
+before the first import; nothing touches Supabase or the working tree.
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+
+import pytest
+
+WORKDIR = tempfile.mkdtemp(prefix="dada_tests_")
+
+os.environ.update({
+    "STORAGE_BACKEND": "sqlite",
+    "SQLITE_PATH": os.path.join(WORKDIR, "certs_0.db"),
+    "KEY_FILE": os.path.join(WORKDIR, "signing_key.base64"),
+    "PDF_CACHE_DIR": os.path.join(WORKDIR, "pdf_cache"),
+    "BULK_JOB_DIR": os.path.join(WORKDIR, "jobs"),
+    "PDF_WORKERS": "1",
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as dada  # noqa: E402
+
+_databases = itertools.count(1)
+
+
+@pytest.fixture
+def app_module():
+    """The app module, backed by a fresh, empty SQLite database"""
+    dada.storage = dada.SQLiteStorage(os.path.join(WORKDIR, f"certs_{next(_databases)}.db"))
+    dada.init_db()
+    dada.invalidate_stats()
+    dada.verify_cache.clear()
+    dada.revocation_list = dada.RevocationList(dada.REVOCATION_REFRESH, dada.REVOCATION_HISTORY)
+    return dada
+
+
+@pytest.fixture
+def issue(app_module):
+    """Sign and store certificates; returns their IDs.
+
+    With created_at, every one of them gets that timestamp, as rows inserted
+    together would.
+    """
+    def issue(count=1, cohort="Cohort A", created_at=None):
+        cert_ids = []
+        for i in range(count):
+            cert_id, data, signature = app_module.sign_certificate(f"Student {i}", "Bitcoin Basics", cohort)
+            app_module.db_insert(cert_id, data, signature)
+            cert_ids.append(cert_id)
+        if created_at:
+            conn = app_module.storage.connection()
+            with conn:
+                conn.executemany("UPDATE certs SET created_at = ? WHERE id = ?",
+                                 [(created_at, cert_id) for cert_id in cert_ids])
+        return cert_ids
+    return issue
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
@@ -0,0 +1,33 @@
+def test_audit_reports_every_certificate(app_module, issue):
+    issue(3)
+    result = app_module.app.test_cli_runner().invoke(args=["audit"])
+    assert result.exit_code == 0, result.output
+    assert "Audited 3 certificates, 0 invalid" in result.output
+
+
+def test_audit_fails_when_the_database_is_down(app_module, issue, monkeypatch):
+    issue(3)
+
+    def down(*args, **kwargs):
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(app_module.storage, "list_page", down)
+    result = app_module.app.test_cli_runner().invoke(args=["audit"])
+    assert result.exit_code != 0
+    assert "Audit stopped after 0 certificates" in result.output
+    assert "Audited" not in result.output
+
+
+def test_audit_fails_when_a_later_page_cannot_be_read(app_module, issue, monkeypatch):
+    issue(501)
+    list_page = app_module.storage.list_page
+
+    def first_page_only(columns, limit, after=None, *args, **kwargs):
+        if after:
+            raise ConnectionError("connection reset")
+        return list_page(columns, limit, after, *args, **kwargs)
+
+    monkeypatch.setattr(app_module.storage, "list_page", first_page_only)
+    result = app_module.app.test_cli_runner().invoke(args=["audit"])
+    assert result.exit_code != 0
+    assert "Audit stopped after 500 certificates" in result.output
@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import time
+import zipfile
+
+ROSTER = b"name,course,cohort\nZed,Bitcoin Basics,Cohort B\nAmy,Bitcoin Basics,Cohort A\n"
+
+
+def write_roster(app_module):
+    os.makedirs(app_module.BULK_JOB_DIR, exist_ok=True)
+    path = os.path.join(app_module.BULK_JOB_DIR, f"upload_{time.monotonic_ns()}.csv")
+    with open(path, "wb") as f:
+        f.write(ROSTER)
+    return path
+
+
+def test_job_runs_outside_a_request_and_uses_saved_url_root(app_module):
+    job = app_module.BulkJob(write_roster(app_module), "https://certs.example.org/")
+    job.save()
+    app_module.run_bulk_job(job)
+
+    assert job.status == "done", job.error
+    assert job.created == 2
+    with zipfile.ZipFile(job.output_path) as archive:
+        assert sorted(archive.namelist()) == ["certificate_Amy.pdf", "certificate_Zed.pdf"]
+    rows, _ = app_module.db_list_page(columns=("id",))
+    assert len(rows) == 2
+    url = app_module.build_verify_url(rows[0]["id"], job.url_root)
+    assert url == f"https://certs.example.org/verify/{rows[0]['id']}"
+
+
+def test_job_state_is_read_back_from_disk(app_module, client):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/", output="pdf")
+    job.save()
+    app_module.run_bulk_job(job)
+
+    # A fresh load is what a different worker process would see
+    with open(app_module.job_state_path(job.id)) as f:
+        assert json.load(f)["status"] == "done"
+    status = client.get(f"/jobs/{job.id}").get_json()
+    assert status["status"] == "done"
+    assert status["created"] == 2
+    download = client.get(status["download_url"])
+    assert download.mimetype == "application/pdf"
+    assert download.data.startswith(b"%PDF-")
+
+
+def test_unknown_or_malformed_job_ids(client):
+    assert client.get("/jobs/" + "0" * 32).status_code == 404
+    assert client.get("/jobs/..%2F..%2Fetc%2Fpasswd").status_code == 404
+
+
+def test_expired_jobs_are_purged(app_module):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/")
+    app_module.run_bulk_job(job)
+    job.finished_at = time.time() - app_module.BULK_JOB_RETENTION - 1
+    job.save()
+
+    app_module.purge_expired_jobs()
+    assert app_module.get_job(job.id) is None
+    assert not os.path.exists(job.output_path)
+
+
+def test_bulk_create_submits_background_job(client):
+    response = client.post("/bulk_create", data={
+        "csvfile": (io.BytesIO(ROSTER), "roster.csv"),
+        "delivery": "background"
+    }, content_type="multipart/form-data", headers={"Accept": "application/json"})
+    assert response.status_code == 202
+    status_url = response.headers["Location"]
+    for _ in range(100):
+        status = client.get(status_url).get_json()
+        if status["status"] in ("done", "failed"):
+            break
+        time.sleep(0.05)
+    assert status["status"] == "done"
+
+
+def stop_heartbeat(app_module, job, seconds_ago):
+    stamp = time.time() - seconds_ago
+    os.utime(app_module.job_state_path(job.id), (stamp, stamp))
+
+
+def test_job_of_an_exited_worker_is_reported_failed(app_module, client):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/")
+    job.status = "running"
+    job.save()
+    stop_heartbeat(app_module, job, app_module.BULK_JOB_STALE + 1)
+
+    status = client.get(f"/jobs/{job.id}").get_json()
+    assert status["status"] == "failed"
+    assert "submit the CSV again" in status["error"]
+
+
+def test_live_jobs_keep_their_heartbeat(app_module):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/")
+    job.status = "running"
+    job.save()
+    stop_heartbeat(app_module, job, app_module.BULK_JOB_STALE + 1)
+    app_module._live_jobs.add(job.id)
+    try:
+        app_module.touch_live_jobs()
+    finally:
+        app_module._live_jobs.discard(job.id)
+    assert app_module.get_job(job.id).status == "running"
+
+
+def test_job_of_an_exited_worker_is_purged_with_its_upload(app_module):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/")
+    job.status = "running"
+    job.save()
+    partial = os.path.join(app_module.BULK_JOB_DIR, f"{job.id}.zip")
+    open(partial, "wb").close()
+    stop_heartbeat(app_module, job, app_module.BULK_JOB_STALE + app_module.BULK_JOB_RETENTION + 1)
+
+    app_module.purge_expired_jobs()
+    assert app_module.get_job(job.id) is None
+    assert not os.path.exists(job.csv_path)
+    assert not os.path.exists(partial)
+
+
+def test_final_state_is_saved_when_the_upload_cannot_be_removed(app_module, monkeypatch):
+    job = app_module.BulkJob(write_roster(app_module), "http://localhost/")
+    unlink = os.unlink
+
+    def refuse_upload(path):
+        if path == job.csv_path:
+            raise PermissionError(path)
+        unlink(path)
+
+    monkeypatch.setattr(os, "unlink", refuse_upload)
+    app_module.run_bulk_job(job)
+    assert app_module.get_job(job.id).status == "done"
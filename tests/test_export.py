@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+
+def test_export_resumes_exactly_after_tied_timestamps(client, issue):
+    # Rows inserted together share created_at; since_id must break the tie
+    cert_ids = issue(6, created_at="2024-01-01 00:00:00.000")
+
+    rows = [json.loads(line) for line in client.get("/api/export").get_data(as_text=True).splitlines()]
+    assert sorted(row["id"] for row in rows) == sorted(cert_ids)
+    middle = rows[2]
+    rest = client.get("/api/export", query_string={"since": middle["created_at"], "since_id": middle["id"]})
+    resumed = [json.loads(line)["id"] for line in rest.get_data(as_text=True).splitlines()]
+    assert resumed == [row["id"] for row in rows[3:]]
+
+
+@pytest.mark.parametrize("args", [
+    ["--since-id", "abc"],
+    ["--since", "2024-01-01T00:00:00Z", "--since-id", 'x",id.gt."'],
+    ["--since", "2024-01-01T00:00:00Z", "--since-id", "abc\n"],
+])
+def test_export_command_rejects_bad_since_id(app_module, args):
+    result = app_module.app.test_cli_runner().invoke(args=["export", *args])
+    assert result.exit_code == 2
+    assert "--since-id" in result.output
+
+
+def test_export_command_writes_ndjson(app_module, issue):
+    issue(3)
+    result = app_module.app.test_cli_runner().invoke(args=["export"])
+    assert result.exit_code == 0, result.output
+    assert len([line for line in result.output.splitlines() if line.startswith("{")]) == 3
@@ -0,0 +1,90 @@
+import pytest
+
+
+@pytest.fixture
+def records(app_module):
+    def make(count):
+        return [app_module.sign_certificate(f"Student {i}", "Bitcoin Basics", "Cohort A") for i in range(count)]
+    return make
+
+
+@pytest.fixture
+def inserts(app_module, monkeypatch):
+    """Wrap storage.insert with a hook run before each call; returns the call log"""
+    monkeypatch.setattr(app_module, "DB_INSERT_BACKOFF", 0)
+    calls, insert = [], app_module.storage.insert
+
+    def install(hook):
+        def wrapped(rows):
+            calls.append(len(rows))
+            return hook(rows, insert)
+        monkeypatch.setattr(app_module.storage, "insert", wrapped)
+        return calls
+    return install
+
+
+def stored_ids(app_module):
+    return {row[0] for row in app_module.storage.connection().execute("SELECT id FROM certs")}
+
+
+def test_outage_retries_the_chunk_and_skips_the_rest(app_module, records, inserts):
+    def down(rows, insert):
+        raise ConnectionError("connection refused")
+
+    calls = inserts(down)
+    batch = records(1200)
+    failed = app_module.db_insert_many(batch, chunk_size=500)
+    assert calls == [500] * (app_module.DB_INSERT_RETRIES + 1)
+    assert set(failed) == {cert_id for cert_id, _, _ in batch}
+    assert all("connection refused" in message for message in failed.values())
+
+
+def test_transient_error_is_retried_whole(app_module, records, inserts):
+    def flaky(rows, insert):
+        if len(calls) == 1:
+            raise TimeoutError("read timed out")
+        return insert(rows)
+
+    calls = inserts(flaky)
+    batch = records(10)
+    assert app_module.db_insert_many(batch) == {}
+    assert calls == [10, 10]
+    assert stored_ids(app_module) == {cert_id for cert_id, _, _ in batch}
+
+
+def test_committed_insert_that_timed_out_counts_as_stored(app_module, records, inserts):
+    def commit_then_timeout(rows, insert):
+        result = insert(rows)
+        if len(calls) == 1:
+            raise TimeoutError("read timed out")
+        return result
+
+    calls = inserts(commit_then_timeout)
+    batch = records(10)
+    assert app_module.db_insert_many(batch) == {}
+    assert calls == [10, 10]
+    assert stored_ids(app_module) == {cert_id for cert_id, _, _ in batch}
+
+
+def test_rejected_row_is_isolated(app_module, records, inserts):
+    batch = records(16)
+    poison = batch[5][0]
+
+    def reject(rows, insert):
+        if any(row["id"] == poison for row in rows):
+            raise ValueError("violates check constraint")
+        return insert(rows)
+
+    inserts(reject)
+    failed = app_module.db_insert_many(batch)
+    assert list(failed) == [poison]
+    assert stored_ids(app_module) == {cert_id for cert_id, _, _ in batch} - {poison}
+
+
+def test_conflicting_row_with_another_signature_fails(app_module, records):
+    batch = records(4)
+    cert_id, data, _ = batch[2]
+    app_module.db_insert(cert_id, data, app_module.sign_certificate("Someone Else")[2])
+    failed = app_module.db_insert_many(batch)
+    assert list(failed) == [cert_id]
+    assert len(stored_ids(app_module)) == 4
@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_list_page_walks_tied_timestamps_without_gaps(app_module, issue, limit):
+    cert_ids = issue(7, created_at="2024-01-01 00:00:00.000")
+    seen, cursor = [], None
+    while True:
+        rows, cursor = app_module.db_list_page(cursor=cursor, limit=limit)
+        seen.extend(row["id"] for row in rows)
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(cert_ids)
+    assert seen == sorted(cert_ids, reverse=True)
+
+
+def test_manage_count_reflects_filters(client, issue):
+    issue(2)
+    issue(1, cohort="Cohort B")
+
+    page = client.get("/manage").get_data(as_text=True)
+    assert "Showing 3 of 3 certificates" in page
+    filtered = client.get("/manage", query_string={"cohort": "Cohort B"}).get_data(as_text=True)
+    assert "Showing 1 matching certificates" in filtered
+    assert "of 3" not in filtered
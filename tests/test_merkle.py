@@ -0,0 +1,125 @@
+import base64
+import copy
+
+import pytest
+
+SIZES = range(1, 40)
+
+
+def issue_batch(app_module, size, cohort="Cohort A"):
+    return app_module.sign_certificates_merkle(
+        [(f"Student {i}", "Bitcoin Basics", cohort) for i in range(size)]
+    )
+
+
+@pytest.fixture
+def verifier(app_module):
+    """A verifier with empty memo and root caches"""
+    return app_module.CertificateVerifier(app_module.vk)
+
+
+def with_fields(app_module, signature, **changes):
+    size, index, proof, root_signature = app_module.decode_merkle_signature(signature)
+    fields = {"size": size, "index": index, "proof": proof, "root_signature": root_signature}
+    fields.update(changes)
+    return app_module.encode_merkle_signature(**fields)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_every_leaf_verifies(app_module, verifier, size):
+    certs = issue_batch(app_module, size)
+    assert len(certs) == size
+    for cert_id, data, signature in certs:
+        assert signature.startswith(app_module.MERKLE_PREFIX)
+        assert verifier.verify(cert_id, data, signature)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_tampered_data_is_rejected(app_module, verifier, size):
+    for cert_id, data, signature in issue_batch(app_module, size):
+        edited = copy.deepcopy(data)
+        edited["name"] += "x"
+        assert not verifier.verify(cert_id, edited, signature)
+
+
+@pytest.mark.parametrize("size", [2, 3, 5, 8, 13, 39])
+def test_proofs_do_not_transfer_between_leaves(app_module, verifier, size):
+    certs = issue_batch(app_module, size)
+    for cert_id, data, _ in certs:
+        for _, other_data, other_signature in certs:
+            if other_data is not data:
+                assert not verifier.verify(cert_id, data, other_signature)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_altered_index_or_size_is_rejected(app_module, verifier, size):
+    for cert_id, data, signature in issue_batch(app_module, size):
+        index = app_module.decode_merkle_signature(signature)[1]
+        for changes in ({"index": index + 1}, {"index": index - 1}, {"index": size},
+                        {"size": size + 1}, {"size": size - 1}, {"size": 2 * size}):
+            assert not verifier.verify(cert_id, data, with_fields(app_module, signature, **changes))
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 16, 39])
+def test_truncated_or_padded_proof_is_rejected(app_module, verifier, size):
+    for cert_id, data, signature in issue_batch(app_module, size):
+        proof = app_module.decode_merkle_signature(signature)[2]
+        variants = [proof + [bytes(32)], [bytes(32)] + proof]
+        if proof:
+            variants += [proof[:-1], proof[1:], proof[::-1] if len(proof) > 1 else [bytes(32)]]
+        for changed in variants:
+            if changed != proof:
+                assert not verifier.verify(cert_id, data, with_fields(app_module, signature, proof=changed))
+
+
+def test_root_signature_from_another_batch_is_rejected(app_module, verifier):
+    first, second = issue_batch(app_module, 4), issue_batch(app_module, 4)
+    other_root_signature = app_module.decode_merkle_signature(second[0][2])[3]
+    for cert_id, data, signature in first:
+        spliced = with_fields(app_module, signature, root_signature=other_root_signature)
+        assert not verifier.verify(cert_id, data, spliced)
+
+
+def test_plain_signature_over_a_root_is_not_a_certificate(app_module, verifier):
+    # A single-leaf root is the leaf hash, but its signature covers the root
+    # message, not the payload, so it can't pass as an individual signature
+    (cert_id, data, signature), = issue_batch(app_module, 1)
+    root_signature = app_module.decode_merkle_signature(signature)[3]
+    assert not verifier.verify(cert_id, data, base64.b64encode(root_signature).decode())
+
+
+@pytest.mark.parametrize("signature", [
+    "m1.",
+    "m1....",
+    "m1.1.0.",
+    "m1.1.0..",
+    "m1.a.0..AAAA",
+    "m1.1.b..AAAA",
+    "m1.2.-1.AAAA.AAAA",
+    "m1.0.0..AAAA",
+    "m1.1.0.!!!!.AAAA",
+    "m1.1.0..not base64",
+    "m1.2.0.AAAA.AAAA",
+    "m1.99999999999.0..AAAA",
+    "m1.1.0...AAAA",
+    "m1.1.0..AAAA.extra",
+    "m1." + "9" * 5000 + ".0..AAAA",
+])
+def test_malformed_signatures_are_rejected(app_module, verifier, signature):
+    (cert_id, data, _), = issue_batch(app_module, 1)
+    assert verifier.verify(cert_id, data, signature) is False
+
+
+def test_malformed_signature_with_real_root_is_rejected(app_module, verifier):
+    (cert_id, data, signature), = issue_batch(app_module, 3)[:1]
+    size, index, proof_b64, root_b64 = signature[len(app_module.MERKLE_PREFIX):].split(".")
+    broken = f"{app_module.MERKLE_PREFIX}{size}.{index}.{proof_b64[:-1]}.{root_b64}"
+    assert not verifier.verify(cert_id, data, broken)
+
+
+def test_batch_verifies_through_the_registry(app_module, client):
+    certs = issue_batch(app_module, 5)
+    for cert in certs:
+        app_module.db_insert(*cert)
+    response = client.post("/api/verify/batch", json={"ids": [cert_id for cert_id, _, _ in certs]})
+    assert response.get_json()["summary"] == {"authentic": 5}
@@ -0,0 +1,30 @@
+import cProfile
+
+
+class BusyProfile(cProfile.Profile):
+    """What Python 3.12+ does while another thread is being profiled"""
+
+    def enable(self, *args, **kwargs):
+        raise ValueError("Another profiling tool is already active")
+
+
+def test_profile_request_is_served_when_profiler_is_busy(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, "PROFILE_HEADER", True)
+    monkeypatch.setattr(app_module.cProfile, "Profile", BusyProfile)
+    response = client.get("/verify", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert "X-Profile-Dump" not in response.headers
+
+
+def test_profile_request_writes_dump(app_module, client, monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module, "PROFILE_HEADER", True)
+    monkeypatch.setattr(app_module, "PROFILE_DIR", str(tmp_path))
+    response = client.get("/verify", headers={"X-Profile": "1"})
+    assert (tmp_path / response.headers["X-Profile-Dump"]).exists()
+
+
+def test_metrics_exposition(client):
+    client.get("/verify")
+    body = client.get("/metrics").get_data(as_text=True)
+    assert "dada_http_requests_total" in body
+    assert 'route="/verify"' in body
@@ -0,0 +1,90 @@
+import io
+import zipfile
+
+import pytest
+
+ROWS = [(2, "Amy", "Bitcoin Basics", "Cohort A"), (3, "Zed", "Bitcoin Basics", "Cohort B")]
+
+
+@pytest.fixture
+def pdf_pool(app_module, monkeypatch):
+    """A real two-process render pool, shut down after the test"""
+    monkeypatch.setattr(app_module, "PDF_WORKERS", 2)
+    monkeypatch.setattr(app_module, "_pdf_pool", None)
+    pool = app_module.get_pdf_pool()
+    yield pool
+    pool.shutdown()
+
+
+def test_pdf_pool_does_not_fork(pdf_pool):
+    assert pdf_pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_bulk_zip_renders_in_pool_while_metrics_lock_is_held(app_module, pdf_pool):
+    # A lock held by another thread when workers start must not reach them
+    with app_module.metrics._lock:
+        future = pdf_pool.submit(app_module.render_sheet, [], 1)
+    future.result(timeout=60)
+
+    out = io.BytesIO()
+    errors = []
+    created = app_module.write_bulk_zip(out, ROWS, errors, url_root="http://localhost/")
+    assert (created, errors) == (2, [])
+    with zipfile.ZipFile(out) as archive:
+        assert all(archive.read(name).startswith(b"%PDF-") for name in archive.namelist())
+
+
+SAMPLE = ({"id": "0b3c1a0e-1111-4222-8333-444455556666", "name": "Zoë Doe 王", "course": "Bitcoin Basics",
+           "cohort": "Cohort A", "issued_at": "2024-01-01 00:00:00 UTC"},
+          "x" * 88, "https://certs.example.org/verify/0b3c1a0e-1111-4222-8333-444455556666")
+
+
+def test_cached_layout_matches_canvas_font_names(app_module):
+    from reportlab.pdfgen import canvas
+    c = canvas.Canvas(io.BytesIO())
+    app_module.register_layout_fonts(c)
+    _, font_names = app_module.static_layout_ops()
+    assert app_module.internal_font_names(c, app_module.LAYOUT_FONTS) == font_names
+
+
+def test_layout_is_redrawn_when_font_names_differ(app_module, monkeypatch):
+    ops, font_names = app_module.static_layout_ops()
+    monkeypatch.setattr(app_module, "_static_layout_ops", (ops, tuple(reversed(font_names))))
+    drawn = []
+    original = app_module.draw_static_layout
+    monkeypatch.setattr(app_module, "draw_static_layout", lambda c: drawn.append(original(c)))
+    assert app_module.create_certificate_pdf(*SAMPLE).startswith(b"%PDF-")
+    assert len(drawn) == 1
+
+
+@pytest.mark.parametrize("per_page", (1, 2, 4))
+def test_merged_pdf_structure(app_module, per_page):
+    out = io.BytesIO()
+    writer = app_module.MergedPdfWriter(out)
+    content = app_module.render_sheet([SAMPLE] * per_page, per_page)
+    writer.add_page(content)
+    writer.add_page(content)
+    writer.close()
+    pdf = out.getvalue()
+
+    assert pdf.startswith(b"%PDF-1.4") and pdf.endswith(b"%%EOF\n")
+    assert pdf.count(b"/Type /Page ") == 2
+    assert pdf.count(b"/Resources 3 0 R") == 2
+    # Every xref offset points at the object it names
+    xref_at = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n")[0])
+    lines = pdf[xref_at:].split(b"\n")
+    count = int(lines[1].split()[1])
+    for number, line in enumerate(lines[3:2 + count], start=1):
+        offset = int(line.split()[0])
+        assert pdf[offset:].startswith(b"%d 0 obj" % number)
+
+
+def test_qr_mask_is_scored_by_default(app_module):
+    import qrcode
+    text = SAMPLE[2]
+    assert app_module.QR_MASK_PATTERN == "auto"
+    reference = qrcode.QRCode(version=app_module.qr_version_for(len(text)),
+                              error_correction=app_module.QR_ERROR_CORRECTION, border=0)
+    reference.add_data(text.encode(), optimize=0)
+    reference.make(fit=False)
+    assert app_module.qr_matrix(text) == reference.modules
@@ -0,0 +1,46 @@
+import os
+
+
+def cache_size(directory):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, files in os.walk(directory) for name in files)
+
+
+def key(name):
+    return name * 64
+
+
+def test_least_recently_used_files_are_evicted(app_module, tmp_path):
+    cache = app_module.PdfCache(str(tmp_path), max_bytes=1000)
+    for name, stamp in (("a", 1000), ("b", 2000), ("c", 3000)):
+        os.utime(cache.put(key(name), b"x" * 300), (stamp, stamp))
+    assert cache.get(key("a"))  # now the most recently used
+
+    cache.put(key("d"), b"x" * 300)
+    assert cache.get(key("b")) is None
+    assert all(cache.get(key(name)) for name in "acd")
+    assert cache_size(str(tmp_path)) <= 1000
+
+
+def test_size_stays_under_the_cap(app_module, tmp_path):
+    cache = app_module.PdfCache(str(tmp_path), max_bytes=1000)
+    for i in range(20):
+        cache.put(f"{i:064x}", b"x" * 150)
+        assert cache_size(str(tmp_path)) <= 1000
+
+
+def test_overwriting_a_key_is_not_counted_twice(app_module, tmp_path):
+    cache = app_module.PdfCache(str(tmp_path), max_bytes=1000, rescan_interval=3600)
+    for _ in range(5):
+        cache.put(key("a"), b"x" * 300)
+    assert cache._size == 300
+    assert cache.get(key("a"))
+
+
+def test_writes_from_other_processes_are_picked_up_by_rescan(app_module, tmp_path):
+    # Two instances on one directory stand in for two worker processes
+    first = app_module.PdfCache(str(tmp_path), max_bytes=1000, rescan_interval=0)
+    second = app_module.PdfCache(str(tmp_path), max_bytes=1000, rescan_interval=0)
+    for i in range(10):
+        (first if i % 2 else second).put(f"{i:064x}", b"x" * 300)
+        assert cache_size(str(tmp_path)) <= 1000
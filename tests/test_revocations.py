@@ -0,0 +1,54 @@
+import base64
+
+import pytest
+from nacl.exceptions import BadSignatureError
+
+
+def fetch_delta(issue, client):
+    cert_id, = issue()
+    since = client.get("/api/revocations").get_json()["version"]
+    client.post("/revoke", data={"id": cert_id})
+    response = client.get(f"/api/revocations?since={since}")
+    return cert_id, since, response
+
+
+def signed_part(body):
+    return {key: body[key] for key in ("since", "version", "added", "removed")}
+
+
+def test_delta_lists_revocation(client, issue):
+    cert_id, since, response = fetch_delta(issue, client)
+    body = response.get_json()
+    assert body["since"] == since
+    assert body["added"] == [cert_id]
+    assert body["removed"] == []
+
+
+def test_delta_signature_is_domain_separated(app_module, client, issue):
+    _, _, response = fetch_delta(issue, client)
+    body = response.get_json()
+    signature = base64.b64decode(body["signature"])
+    message = app_module.serialize_data(signed_part(body))
+
+    assert body["signature_context"] == "DADA-REVOCATION-DELTA-V1"
+    app_module.vk.verify(body["signature_context"].encode() + message, signature)
+    with pytest.raises(BadSignatureError):
+        app_module.vk.verify(message, signature)
+
+
+def test_delta_signature_is_not_a_certificate_signature(app_module, client, issue):
+    cert_id, _, response = fetch_delta(issue, client)
+    body = response.get_json()
+    forged = {"id": cert_id, "data": signed_part(body), "signature": body["signature"]}
+
+    result = client.post("/api/verify/batch", json={"certificates": [forged]}).get_json()
+    assert result["results"][0]["status"] != "authentic"
+
+
+@pytest.mark.parametrize("since", ['a"b', "unknown", ""])
+def test_unknown_since_serves_full_snapshot_with_version_etag(app_module, client, since):
+    full = client.get("/api/revocations")
+    response = client.get("/api/revocations", query_string={"since": since})
+    assert response.status_code == 200
+    assert "snapshot" in response.get_json()
+    assert response.headers["ETag"] == full.headers["ETag"]
@@ -0,0 +1,172 @@
+import sqlite3
+
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.error = None
+
+
+class FakeQuery:
+    """The slice of the PostgREST query builder used by the lookups"""
+
+    def __init__(self, table, columns):
+        self.table = table
+        self.columns = [column.strip() for column in columns.split(",")]
+        self.filters = []
+        self.ordering = []
+        self.count = None
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in set(values))
+        return self
+
+    def order(self, column, desc=False):
+        self.ordering.insert(0, (column, desc))
+        return self
+
+    def limit(self, count):
+        self.count = count
+        return self
+
+    def execute(self):
+        self.table.selects.append(self.columns)
+        missing = [column for column in self.columns if column not in self.table.schema]
+        if missing:
+            raise Exception({"code": "42703", "message": f"column certs.{missing[0]} does not exist"})
+        rows = [row for row in self.table.rows if all(match(row) for match in self.filters)]
+        for column, desc in self.ordering:
+            rows.sort(key=lambda row: row.get(column) or "", reverse=desc)
+        rows = rows[:self.count]
+        return FakeResponse([{column: row.get(column) for column in self.columns} for row in rows])
+
+
+class FakeInsert:
+    def __init__(self, table, rows):
+        self.table = table
+        self.rows = rows
+
+    def execute(self):
+        for row in self.rows:
+            missing = [column for column in row if column not in self.table.schema]
+            if missing:
+                raise Exception({"code": "PGRST204",
+                                 "message": f"Could not find the '{missing[0]}' column of 'certs' in the schema cache"})
+        stamp = len(self.table.rows)
+        for offset, row in enumerate(self.rows):
+            self.table.rows.append(dict(row, created_at=f"2024-01-01T00:00:{stamp + offset:02d}+00:00"))
+        return FakeResponse(self.rows)
+
+
+class FakeTable:
+    def __init__(self, schema, rows):
+        self.schema = schema
+        self.rows = rows
+        self.selects = []
+
+    def select(self, columns):
+        return FakeQuery(self, columns)
+
+    def insert(self, rows):
+        return FakeInsert(self, rows)
+
+
+class FakeClient:
+    def __init__(self, table):
+        self._table = table
+
+    def table(self, name):
+        return self._table
+
+
+@pytest.fixture
+def legacy_supabase(app_module, monkeypatch):
+    """SupabaseStorage over a certs table that has not run PAYLOAD_MIGRATION_SQL"""
+    cert_id, data, signature = app_module.sign_certificate("Jane Doe", "Bitcoin Development", "Cohort 2024")
+    row = {"id": cert_id, "data": app_module.serialize_data(data).decode(), "signature": signature, "revoked": None,
+           "created_at": "2023-12-31T00:00:00+00:00"}
+    table = FakeTable({"id", "data", "signature", "revoked", "created_at"}, [row])
+    storage = app_module.SupabaseStorage("https://example.supabase.co", "key")
+    storage._client = FakeClient(table)
+    monkeypatch.setattr(app_module, "storage", storage)
+    return cert_id, table
+
+
+def test_verify_falls_back_when_payload_column_is_missing(app_module, client, legacy_supabase):
+    cert_id, table = legacy_supabase
+    response = client.get(f"/api/certificate/{cert_id}")
+    assert response.status_code == 200
+    assert response.get_json()["revoked"] is False
+
+    result = client.post("/api/verify/batch", json={"ids": [cert_id]}).get_json()
+    assert result["results"][0]["status"] == "authentic"
+
+
+def test_missing_payload_column_is_remembered(app_module, legacy_supabase):
+    cert_id, table = legacy_supabase
+    app_module.db_get(cert_id)
+    app_module.db_get(cert_id)
+    assert [columns for columns in table.selects if "payload" in columns] == [["data", "signature", "revoked", "payload"]]
+
+
+def test_issue_falls_back_when_payload_column_is_missing(app_module, client, legacy_supabase):
+    _, table = legacy_supabase
+    response = client.post("/create", data={"name": "John Doe", "course": "Bitcoin Basics", "cohort": "Cohort 1"})
+    assert response.status_code == 200
+    assert len(table.rows) == 2
+    assert "payload" not in table.rows[-1]
+
+    cert_id, data, signature = app_module.sign_certificate("Ann Lee")
+    assert app_module.db_insert_many([(cert_id, data, signature)]) == {}
+    assert app_module.get_certificate(cert_id).signature_valid
+
+
+def test_export_and_audit_fall_back_when_payload_column_is_missing(app_module, client, legacy_supabase):
+    cert_id, _ = legacy_supabase
+    app_module.db_insert(*app_module.sign_certificate("Ann Lee"))
+
+    lines = client.get("/api/export").get_data(as_text=True).splitlines()
+    assert len(lines) == 2
+    assert cert_id in lines[0]
+    result = app_module.app.test_cli_runner().invoke(args=["audit"])
+    assert result.exit_code == 0, result.output
+    assert "Audited 2 certificates, 0 invalid" in result.output
+
+
+LEGACY_SQLITE_SCHEMA = """
+CREATE TABLE certs (
+    id TEXT PRIMARY KEY,
+    data TEXT,
+    signature TEXT,
+    revoked INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def test_sqlite_bulk_revoke_treats_null_as_active(app_module, monkeypatch, tmp_path):
+    # The bundled certs.db predates the NOT NULL constraint on revoked
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(LEGACY_SQLITE_SCHEMA)
+    conn.close()
+    monkeypatch.setattr(app_module, "storage", app_module.SQLiteStorage(path))
+    app_module.init_db()
+
+    cert_id, data, signature = app_module.sign_certificate("Jane Doe", "Bitcoin Development", "Cohort 2024")
+    app_module.db_insert(cert_id, data, signature)
+    conn = app_module.storage.connection()
+    with conn:
+        conn.execute("UPDATE certs SET revoked = NULL WHERE id = ?", (cert_id,))
+
+    assert app_module.storage.count(revoked=False) == 1
+    assert app_module.db_set_revoked_many(True, cert_ids=[cert_id]) == 1
+    assert app_module.storage.count(revoked=True) == 1
+    assert app_module.get_certificate(cert_id).revoked
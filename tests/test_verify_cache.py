@@ -0,0 +1,42 @@
+import pytest
+
+
+@pytest.fixture(params=["/verify/{}", "/api/certificate/{}"])
+def url(request, issue):
+    return request.param.format(issue()[0])
+
+
+def test_repeat_scan_is_answered_with_304(client, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    again = client.get(url, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert not again.data
+
+
+def test_revoke_changes_the_etag(app_module, client, url):
+    etag = client.get(url).headers["ETag"]
+    cert_id = url.rsplit("/", 1)[1]
+    app_module.db_set_revoked(cert_id, True)
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_anonymous_scan_is_shareable(client, url):
+    response = client.get(url)
+    assert "public" in response.headers["Cache-Control"]
+    assert "s-maxage" in response.headers["Cache-Control"]
+    assert "Cookie" not in response.headers.get("Vary", "")
+    assert "Set-Cookie" not in response.headers
+
+
+def test_page_with_a_flashed_message_is_not_shared(client, issue):
+    cert_id, = issue()
+    client.post("/revoke", data={"id": cert_id})  # flashes, then redirects
+    response = client.get(f"/verify/{cert_id}")
+    assert "Certificate revoked successfully" in response.get_data(as_text=True)
+    assert "no-store" in response.headers["Cache-Control"]
+    assert "public" not in response.headers["Cache-Control"]